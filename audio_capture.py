@@ -12,6 +12,7 @@ import threading
 import queue
 import time
 import logging
+from functools import cached_property
 from scipy import signal
 
 logging.basicConfig(level=logging.INFO)
@@ -134,17 +135,30 @@ class AudioCapture:
         self.buffer_progress = 0.0  # 0.0 to 1.0 — how full the accumulation buffer is
         self.callbacks_received = 0  # total audio callbacks from all devices
         self.no_audio_warned = False  # True after first "no audio" warning
+        self._devices = None  # cached result of get_loopback_devices()
+
+    @cached_property
+    def _wasapi_index(self):
+        """WASAPI host-API index — fixed for the lifetime of the PyAudio instance."""
+        return self.audio.get_host_api_info_by_type(pyaudio.paWASAPI).get('index')
+
+    def get_loopback_devices(self, refresh=False):
+        """Get list of available loopback devices.
+
+        The enumeration is cached; pass refresh=True to rescan (e.g. after
+        plugging in a headset).
+        """
+        if self._devices is not None and not refresh:
+            return self._devices
 
-    def get_loopback_devices(self):
-        """Get list of available loopback devices"""
         devices = []
         try:
-            wasapi_info = self.audio.get_host_api_info_by_type(pyaudio.paWASAPI)
+            wasapi_index = self._wasapi_index
 
             for i in range(self.audio.get_device_count()):
                 device_info = self.audio.get_device_info_by_index(i)
 
-                if (device_info.get('hostApi') == wasapi_info.get('index') and
+                if (device_info.get('hostApi') == wasapi_index and
                     device_info.get('maxInputChannels') > 0):
 
                     name = device_info.get('name', '')
@@ -194,14 +208,27 @@ class AudioCapture:
             logger.error(f"Error getting loopback devices: {e}")
 
         logger.info(f"Found {len(devices)} loopback device(s): {[d['name'] for d in devices]}")
+        self._devices = devices
         return devices
 
     def _open_all_devices(self):
         """Open ALL available loopback devices simultaneously. Returns number opened."""
         devices = self.get_loopback_devices()
+        opened = self._open_devices(devices)
 
+        if not devices or opened < len(devices):
+            # A cached device is gone or a new one may have appeared (headset plugged or unplugged):
+            # rescan and open whatever the cached list didn't already cover
+            logger.info("Rescanning loopback devices...")
+            open_indices = {ds.device_index for ds in self.device_streams}
+            devices = [d for d in self.get_loopback_devices(refresh=True) if d['index'] not in open_indices]
+            opened += self._open_devices(devices)
+
+        return opened
+
+    def _open_devices(self, devices):
+        """Open the given loopback devices alongside any already open. Returns number opened."""
         if not devices:
-            logger.error("No loopback devices available")
             return 0
 
         opened = 0
@@ -377,12 +404,18 @@ class AudioCapture:
 
                     logger.info(f"Sending {len(full_audio)} samples ({len(full_audio)/16000:.1f}s) to transcription (RMS={rms_energy:.6f})")
 
-                    # Non-blocking put — if transcription is backed up, drop this chunk
+                    # Non-blocking put — if transcription is backed up, drop the OLDEST chunk
+                    # so the captions stay close to real time instead of lagging further behind
                     try:
                         self.transcription_queue.put_nowait(full_audio)
                     except queue.Full:
+                        try:
+                            self.transcription_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+                        self.transcription_queue.put_nowait(full_audio)
                         self.dropped_chunks += 1
-                        logger.warning(f"Transcription queue full — dropped chunk #{self.dropped_chunks}. "
+                        logger.warning(f"Transcription queue full — dropped oldest chunk #{self.dropped_chunks}. "
                                        f"Whisper is falling behind. Consider using a smaller model.")
 
                     # Keep overlap to avoid cutting words at chunk boundaries
@@ -480,5 +513,7 @@ class AudioCapture:
     def cleanup(self):
         """Cleanup audio resources"""
         self.stop_recording()
+        self._devices = None
+        self.__dict__.pop('_wasapi_index', None)
         if self.audio:
             self.audio.terminate()
@@ -9,6 +9,7 @@ import sys
 import json
 import logging
 import subprocess
+import multiprocessing
 import atexit
 
 # Add current directory to path
@@ -34,6 +35,13 @@ def load_config():
         "whisper_model": "base",
         "language": "auto",
         "device": "auto",
+        "backend": "auto",
+        "torch_compile": False,
+        "file_workers": 1,
+        "model_workers": 1,
+        "cpu_bf16": False,
+        "live_batching": False,
+        "ct2_convert": False,
         "window_opacity": 0.95,
         "always_on_top": True,
         "buffer_duration": 10
@@ -86,7 +94,14 @@ def main():
     transcriber = Transcriber(
         model_size=config['whisper_model'],
         device=config['device'],
-        language=config['language']
+        language=config['language'],
+        backend=config['backend'],
+        torch_compile=config['torch_compile'],
+        file_workers=config['file_workers'],
+        model_workers=config['model_workers'],
+        cpu_bf16=config['cpu_bf16'],
+        live_batching=config['live_batching'],
+        ct2_convert=config['ct2_convert']
     )
 
     # --- AI Assistant disabled for now (uncomment to re-enable) ---
@@ -152,4 +167,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # file_workers process pool in the PyInstaller build
     main()
@@ -335,16 +335,28 @@ function setupIPC() {
 
   // Transcript: get live transcript from Python app
   ipcMain.handle('transcript:get-live', () => {
-    const transcriptPath = path.join(
+    const transcriptDir = path.join(
       process.env.LOCALAPPDATA || path.join(require('os').homedir(), 'AppData', 'Local'),
-      'meeting-transcriber',
-      'live_transcript.json'
+      'meeting-transcriber'
     );
+    // Metadata (with the segment count) is replaced atomically; segments are appended as JSON lines
+    const metaPath = path.join(transcriptDir, 'live_transcript.meta.json');
+    const segmentsPath = path.join(transcriptDir, 'live_transcript.ndjson');
 
     try {
-      if (fs.existsSync(transcriptPath)) {
-        const raw = fs.readFileSync(transcriptPath, 'utf8');
-        const data = JSON.parse(raw);
+      if (fs.existsSync(metaPath)) {
+        const meta = JSON.parse(fs.readFileSync(metaPath, 'utf8'));
+        const lines = fs.existsSync(segmentsPath)
+          ? fs.readFileSync(segmentsPath, 'utf8').split('\n')
+          : [];
+        // Only the first `count` lines: anything after may still be mid-write
+        const segments = lines.slice(0, meta.count).filter(Boolean).map((line) => JSON.parse(line));
+        const data = {
+          timestamp: meta.timestamp,
+          segments,
+          session_id: meta.session_id,
+          is_active: meta.is_active,
+        };
         return { success: true, data };
       }
       return { success: false, error: 'No live transcript found. Start live transcription first.' };
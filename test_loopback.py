@@ -22,22 +22,13 @@ try:
     print(f"Channels: {default_speakers['maxInputChannels']}")
     print(f"Rate: {default_speakers['defaultSampleRate']}")
 
-    # Try recording with callback
-    print("\nIntentando grabar 3 segundos con callback...")
+    # Blocking reads: PortAudio buffers in C and no Python runs on the audio
+    # thread, so GIL/GC pauses can't cause dropouts during the test.
+    print("\nIntentando grabar 3 segundos (lectura bloqueante)...")
 
-    callback_count = [0]
-    max_amplitude = [0]
-
-    def callback(in_data, frame_count, time_info, status):
-        callback_count[0] += 1
-        audio_data = np.frombuffer(in_data, dtype=np.int16)
-        max_amp = np.max(np.abs(audio_data))
-        max_amplitude[0] = max(max_amplitude[0], max_amp)
-
-        if callback_count[0] % 10 == 0:
-            print(f"  Callback #{callback_count[0]}: {frame_count} frames, max amplitude: {max_amp}")
-
-        return (in_data, pyaudio.paContinue)
+    block_count = 0
+    max_amplitude = 0
+    frames_per_buffer = 1024
 
     stream = p.open(
         format=pyaudio.paInt16,
@@ -45,32 +36,41 @@ try:
         rate=int(default_speakers['defaultSampleRate']),
         input=True,
         input_device_index=default_speakers['index'],
-        frames_per_buffer=1024,
-        stream_callback=callback
+        frames_per_buffer=frames_per_buffer,
     )
 
     print(f"Stream abierto: is_active={stream.is_active()}")
     stream.start_stream()
     print(f"Stream iniciado: is_active={stream.is_active()}")
 
-    # Wait for 3 seconds
-    time.sleep(3)
+    # Read for 3 seconds
+    deadline = time.monotonic() + 3
+    while time.monotonic() < deadline:
+        in_data = stream.read(frames_per_buffer, exception_on_overflow=False)
+        block_count += 1
+        # Two reductions over a zero-copy view; int() before negating so -32768 doesn't wrap
+        audio_data = np.frombuffer(in_data, dtype=np.int16)
+        max_amp = max(-int(audio_data.min()), int(audio_data.max())) if audio_data.size else 0
+        max_amplitude = max(max_amplitude, max_amp)
+
+        if block_count % 10 == 0:
+            print(f"  Bloque #{block_count}: {frames_per_buffer} frames, max amplitude: {max_amp}")
 
     stream.stop_stream()
     stream.close()
 
     print(f"\nResultados:")
-    print(f"  Total callbacks: {callback_count[0]}")
-    print(f"  Max amplitude detectada: {max_amplitude[0]}")
+    print(f"  Total bloques: {block_count}")
+    print(f"  Max amplitude detectada: {max_amplitude}")
 
-    if callback_count[0] == 0:
-        print("\n[ERROR] El callback nunca fue llamado!")
+    if block_count == 0:
+        print("\n[ERROR] No se recibio ningun bloque de audio!")
         print("  Posibles causas:")
         print("  - PyAudioWPatch no esta correctamente instalado")
         print("  - El dispositivo no soporta loopback")
         print("  - Permisos de audio")
-    elif max_amplitude[0] == 0:
-        print("\n[WARNING] Callbacks recibidos pero sin senal de audio")
+    elif max_amplitude == 0:
+        print("\n[WARNING] Bloques recibidos pero sin senal de audio")
         print("  - Verifica que haya audio reproduciendose")
         print("  - Verifica el dispositivo de salida seleccionado")
     else:
@@ -4,17 +4,36 @@ Tkinter-based GUI for the Meeting Notes Assistant
 Supports file upload transcription and live stream-only transcription.
 """
 
+import asyncio
 import tkinter as tk
-from tkinter import ttk, scrolledtext, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox
 import json
+import logging
 import os
+import queue
+from collections import deque
 from datetime import datetime
 import threading
 from threading import Lock
 import time
 
+logger = logging.getLogger(__name__)
+
+SEGMENT_POLL_MS = 100  # how often pending segments (live and file) are pulled into the text area
+MODEL_VALUES = ('tiny', 'base', 'small', 'medium', 'large')
+LANGUAGE_VALUES = ('auto', 'en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'pl', 'ru', 'ja', 'zh')
+MAX_VISIBLE_LINES = 5000  # older lines are trimmed from the text area; saving uses transcription_segments
+LIVE_SAVE_DEBOUNCE_MS = 500  # segment bursts within this window share one live_transcript.meta.json write
+
 
 class TranscriberUI:
+    MEDIA_FILETYPES = (
+        ("Video files", "*.mp4 *.mkv *.avi *.webm *.mov *.wmv"),
+        ("Audio files", "*.mp3 *.wav *.m4a *.ogg *.flac *.wma"),
+        ("All files", "*.*"),
+    )
+    TEXT_FILETYPES = (("Text files", "*.txt"), ("All files", "*.*"))
+
     def __init__(self, audio_capture, transcriber, config):
         """
         Initialize UI
@@ -44,17 +63,46 @@ class TranscriberUI:
         self.live_segment_offset = 0.0
         self._offset_lock = Lock()
         self._chunk_counter = 0  # monotonic chunk counter for correct offset
+        self._live_status_detail = None  # set by _on_live_chunk_done, shown by _render_live_status
+        self._pending_segments = deque()  # (segment, display line) pairs from the live worker thread
+        self._ui_calls = deque()  # (func, args) queued by background work, run by _poll_segments
+        self._latest_status = None  # newest progress text from the file job; only it gets shown
+        self._status_generation = 0  # bumped by every new status, so a late one can tell it was superseded
+        self._loading_status_generation = None  # _status_generation right after "Loading model..."
+        self._status_lock = Lock()  # guards _latest_status and _status_generation across threads
+        self._closing = threading.Event()  # set on window close; stops an in-flight file job
+        self._file_error = None  # last "Error: ..." status of the running file job
+        self._model_load = None  # event-loop Future of the current/last load_model() call
+        self._model_settings = None  # (model size, language) that load is for
+
+        # One long-lived event loop for file jobs, bridged to Tk through _ui_calls
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
 
         # Shared transcript file for overlay integration
         self.live_transcript_dir = os.path.join(
             os.environ.get('LOCALAPPDATA', os.path.expanduser('~')),
             'meeting-transcriber'
         )
-        self.live_transcript_path = os.path.join(self.live_transcript_dir, 'live_transcript.json')
+        # Segments as JSON lines (appended), plus a small metadata file the overlay reads first
+        self.live_transcript_path = os.path.join(self.live_transcript_dir, 'live_transcript.ndjson')
+        self.live_transcript_meta_path = os.path.join(self.live_transcript_dir, 'live_transcript.meta.json')
+        self._live_save_timer = None  # pending debounced _save_live_transcript
+        self._live_saved_count = 0  # segments handed to the writer this session
+        # Ordered jobs for the writer thread: ('reset' | 'append', segments) or ('meta', dict)
+        self._live_save_queue = queue.Queue()
+        threading.Thread(target=self._live_transcript_writer, daemon=True).start()
 
         self._setup_ui()
         self._apply_config()
 
+        # Built once and reused; show() only swaps per-call options
+        self._open_dialog = filedialog.Open(self.root, title="Select Video or Audio File",
+                                            filetypes=self.MEDIA_FILETYPES)
+        self._save_dialog = filedialog.SaveAs(self.root, defaultextension=".txt",
+                                              filetypes=self.TEXT_FILETYPES)
+        self.root.after(SEGMENT_POLL_MS, self._poll_segments)
+
     def _setup_ui(self):
         """Setup the UI components"""
         # Main frame
@@ -78,7 +126,7 @@ class TranscriberUI:
         model_combo = ttk.Combobox(
             control_frame,
             textvariable=self.model_var,
-            values=['tiny', 'base', 'small', 'medium', 'large'],
+            values=MODEL_VALUES,
             state="readonly",
             width=15
         )
@@ -90,7 +138,7 @@ class TranscriberUI:
         language_combo = ttk.Combobox(
             control_frame,
             textvariable=self.language_var,
-            values=['auto', 'en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'pl', 'ru', 'ja', 'zh'],
+            values=LANGUAGE_VALUES,
             state="readonly",
             width=15
         )
@@ -159,15 +207,23 @@ class TranscriberUI:
         trans_frame.columnconfigure(0, weight=1)
         trans_frame.rowconfigure(0, weight=1)
 
-        # Transcription text area
-        self.text_area = scrolledtext.ScrolledText(
+        # Transcription text area: a plain Text and scrollbar in the frame's grid,
+        # no extra wrapper Frame as with ScrolledText
+        self.text_area = tk.Text(
             trans_frame,
             wrap=tk.WORD,
             width=80,
             height=20,
-            font=("Consolas", 10)
+            font=("Consolas", 10),
+            # Append-only transcript: no undo history to record on each insert
+            undo=False,
+            maxundo=0,
+            autoseparators=False
         )
         self.text_area.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        text_scrollbar = ttk.Scrollbar(trans_frame, orient=tk.VERTICAL, command=self.text_area.yview)
+        text_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.text_area.configure(yscrollcommand=text_scrollbar.set)
 
         # --- Button Frame ---
         button_frame = ttk.Frame(main_frame)
@@ -197,15 +253,15 @@ class TranscriberUI:
 
     def _apply_config(self):
         """Apply configuration settings"""
-        if self.config.get('always_on_top', True):
-            self.root.attributes('-topmost', True)
-
-        opacity = self.config.get('window_opacity', 0.95)
-        self.root.attributes('-alpha', opacity)
+        # Both window attributes in a single `wm attributes` call
+        self.root.wm_attributes(
+            '-topmost', bool(self.config.get('always_on_top', True)),
+            '-alpha', float(self.config.get('window_opacity', 0.95)),
+        )
 
     def _refresh_devices(self):
         """Refresh the list of loopback audio devices"""
-        self.loopback_devices = self.audio_capture.get_loopback_devices()
+        self.loopback_devices = self.audio_capture.get_loopback_devices(refresh=True)
 
         if self.loopback_devices:
             # "All Devices" captures from every output simultaneously — never misses audio
@@ -274,20 +330,32 @@ class TranscriberUI:
         if not self._show_consent_dialog():
             return
 
-        # Load model if not loaded
-        if self.transcriber.model is None:
+        # Load the model (or wait for the startup preload) before capture starts. The Tk thread
+        # doesn't wait on it: capture starts from a continuation once the load is done.
+        settings = (self.model_var.get(), self.language_var.get())
+        if self.transcriber.model is None or self._model_settings != settings:
             self._update_status("Loading Whisper model...")
-            self.root.update()
+        self.live_btn.config(state='disabled')
+        self.upload_btn.config(state='disabled')
 
-            model_size = self.model_var.get()
-            language = self.language_var.get()
-            self.transcriber.model_size = model_size
-            self.transcriber.language = None if language == "auto" else language
+        load = asyncio.run_coroutine_threadsafe(self._ensure_model_async(*settings), self._loop)
+        load.add_done_callback(lambda done: self._call_in_ui(self._finish_live_start, device_index, done))
 
-            if not self.transcriber.load_model():
-                messagebox.showerror("Error", "Failed to load Whisper model")
-                self._update_status("Ready \u2014 Upload a file or start live transcription")
-                return
+    def _finish_live_start(self, device_index, load):
+        """Continuation of _start_live_transcription on the Tk thread, once the model is loaded"""
+        if self._closing.is_set():
+            return
+        self.live_btn.config(state='normal')
+        self.upload_btn.config(state='normal')
+        try:
+            loaded = load.result()
+        except Exception:
+            logger.exception("Model load for live transcription failed")
+            loaded = False
+        if not loaded:
+            messagebox.showerror("Error", "Failed to load Whisper model")
+            self._update_status("Ready \u2014 Upload a file or start live transcription")
+            return
 
         # Define transcription callback (called from transcription worker thread)
         def on_audio_chunk(audio_data):
@@ -314,17 +382,22 @@ class TranscriberUI:
                 # Offset timestamps relative to session start
                 seg['start'] += chunk_offset
                 seg['end'] += chunk_offset
-                self.root.after(0, self._add_transcription_segment, seg)
+                # Format here on the worker so the Tk thread only joins ready-made lines
+                self._pending_segments.append((seg, self._segment_line(seg)))
 
             # Update offset for next chunk (net duration only, overlap already counted)
             with self._offset_lock:
                 self.live_segment_offset = chunk_offset + net_duration
 
+            # Drop/queue counters only change around chunks, so the status refreshes them here
+            self._call_in_ui(self._on_live_chunk_done)
+
         # Start capture
         self.is_live_transcribing = True
         self.live_start_time = time.time()
         self.live_segment_offset = 0.0
         self._chunk_counter = 0
+        self._live_status_detail = None  # drop/queue status text; None until the first chunk is done
 
         # Show header
         self.text_area.insert(tk.END, f"--- Live Transcription Started: {datetime.now().strftime('%H:%M:%S')} ---\n\n")
@@ -343,41 +416,60 @@ class TranscriberUI:
             self._update_status("Ready \u2014 Upload a file or start live transcription")
             return
 
+        # New overlay session: rewrite the segment file once, then only append
+        self._reset_live_transcript()
+
         # Update UI
         self.live_btn.config(text="\u23f9 Stop Live Transcription")
         self.upload_btn.config(state='disabled')
         self._update_live_status()
 
     def _update_live_status(self):
-        """Update status bar with elapsed time during live transcription"""
+        """Clock tick: refresh the elapsed time once a second during live transcription"""
         if not self.is_live_transcribing:
             return
 
-        elapsed = time.time() - self.live_start_time
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        self._render_live_status()
 
-        device_count = len(self.audio_capture.active_device_names)
-        status = f"\U0001f534 TRANSCRIBING LIVE \u2014 {minutes:02d}:{seconds:02d}  ({device_count} device(s))"
+        self.live_elapsed_timer = self.root.after(1000, self._update_live_status)
 
-        # Show buffer progress when waiting for first chunk
-        buffer_pct = int(self.audio_capture.buffer_progress * 100)
-        if buffer_pct < 100:
-            status += f"  | Buffering: {buffer_pct}%"
+    def _on_live_chunk_done(self):
+        """A chunk was transcribed: refresh the drop/queue part of the status (Tk thread)"""
+        if not self.is_live_transcribing:
+            return
 
+        detail = ""
         # Show warning if audio chunks are being dropped
         dropped = self.audio_capture.dropped_chunks
         if dropped > 0:
-            status += f"  \u26a0\ufe0f {dropped} chunk(s) dropped — Whisper falling behind"
+            detail += f"  \u26a0\ufe0f {dropped} chunk(s) dropped — Whisper falling behind"
 
         # Show pending queue size for visibility
         pending = self.audio_capture.transcription_queue.qsize()
         if pending > 0:
-            status += f"  | Queue: {pending}"
+            detail += f"  | Queue: {pending}"
 
-        self._update_status(status)
+        self._live_status_detail = detail
+        self._render_live_status()
 
-        self.live_elapsed_timer = self.root.after(1000, self._update_live_status)
+    def _render_live_status(self):
+        """Compose the live status from the clock and the last chunk's details"""
+        elapsed = time.time() - self.live_start_time
+        minutes = int(elapsed // 60)
+        seconds = int(elapsed % 60)
+
+        device_count = len(self.audio_capture.active_device_names)
+        status = f"\U0001f534 TRANSCRIBING LIVE \u2014 {minutes:02d}:{seconds:02d}  ({device_count} device(s))"
+
+        if self._live_status_detail is None:
+            # Show buffer progress when waiting for first chunk
+            buffer_pct = int(self.audio_capture.buffer_progress * 100)
+            if buffer_pct < 100:
+                status += f"  | Buffering: {buffer_pct}%"
+        else:
+            status += self._live_status_detail
+
+        self._update_status(status)
 
     def _stop_live_transcription(self):
         """Stop live transcription"""
@@ -389,19 +481,21 @@ class TranscriberUI:
 
         self.audio_capture.stop_recording()
 
-        # Show footer
+        # Show footer, in the same insert as any segments still pending
         elapsed = time.time() - self.live_start_time if self.live_start_time else 0
         minutes = int(elapsed // 60)
         seconds = int(elapsed % 60)
-        self.text_area.insert(tk.END,
+        self._flush_segments(
             f"\n--- Live Transcription Stopped: {datetime.now().strftime('%H:%M:%S')} "
             f"(duration: {minutes:02d}:{seconds:02d}) ---\n\n")
-        self.text_area.see(tk.END)
 
         self.live_start_time = None
         self.live_segment_offset = 0.0
 
-        # Mark transcript as inactive for overlay
+        # Mark transcript as inactive for overlay; this final write also covers any pending debounced save
+        if self._live_save_timer is not None:
+            self.root.after_cancel(self._live_save_timer)
+            self._live_save_timer = None
         self._clear_live_transcript()
 
         # Re-enable UI
@@ -411,60 +505,158 @@ class TranscriberUI:
 
     # --- File Upload Transcription ---
 
-    def _add_transcription_segment(self, segment):
-        """Add a transcription segment to the display"""
-        self.transcription_segments.append(segment)
-
-        timestamp = self.transcriber.format_timestamp(segment['start'])
-        text = f"[{timestamp}] {segment['text']}\n\n"
-
+    def _poll_segments(self):
+        """Show pending segments and run queued UI calls on the Tk thread, then re-arm the timer"""
+        try:
+            self._flush_segments()
+            with self._status_lock:
+                status, self._latest_status = self._latest_status, None
+            if status is not None:
+                self._show_status(status)
+            calls = self._ui_calls
+            for _ in range(len(calls)):
+                func, args = calls.popleft()
+                # One failing callback must not drop the rest of the queue
+                try:
+                    func(*args)
+                except Exception:
+                    logger.exception(f"UI callback {getattr(func, '__name__', func)} failed")
+        except Exception:
+            logger.exception("Segment poll failed")
+        finally:
+            # Always re-arm, or segments and status stop updating for the rest of the session
+            self.root.after(SEGMENT_POLL_MS, self._poll_segments)
+
+    def _call_in_ui(self, func, *args):
+        """Queue func(*args) to run on the Tk thread; safe from any thread"""
+        self._ui_calls.append((func, args))
+
+    def _flush_segments(self, trailer=""):
+        """Move every pending live and file segment, then `trailer`, into the display at once"""
+        pending = self._pending_segments
+        entries = [pending.popleft() for _ in range(len(pending))]
+        entries.extend((seg, self._segment_line(seg)) for seg in self.transcriber.drain_segments())
+        if entries or trailer:
+            self._add_transcription_segments(entries, trailer)
+
+    def _segment_line(self, segment):
+        """Display line for one segment"""
+        return f"[{self.transcriber.format_timestamp(segment['start'])}] {segment['text']}\n\n"
+
+    def _add_transcription_segments(self, entries, trailer=""):
+        """Add (segment, display line) pairs, plus an optional closing line, with a single insert"""
+        self.transcription_segments.extend(seg for seg, _ in entries)
+        text = "".join([line for _, line in entries] + [trailer])
+
+        self._append_text(text)
+
+        # Export live transcript for overlay integration (live_start_time also covers the final flush on stop)
+        if self.live_start_time is not None:
+            self._append_live_segments([seg for seg, _ in entries])
+            self._schedule_live_save()
+
+    def _append_text(self, text):
+        """Insert text at the end, following it only if the view was already at the bottom"""
+        # Checked before the insert: afterwards the new text itself pushes the view off the bottom
+        at_bottom = self.text_area.yview()[1] > 0.98
         self.text_area.insert(tk.END, text)
-        self.text_area.see(tk.END)
-
-        # Export live transcript for overlay integration
+        if at_bottom:
+            # Only follow (and trim) the tail when already there, so scrolling back isn't yanked around
+            self._trim_text_area()
+            self.text_area.see(tk.END)
+
+    def _trim_text_area(self):
+        """Keep the Text widget at MAX_VISIBLE_LINES; its layout cost grows with its size"""
+        line_count = int(self.text_area.index('end-1c').split('.')[0])
+        if line_count > MAX_VISIBLE_LINES:
+            self.text_area.delete('1.0', f'{line_count - MAX_VISIBLE_LINES}.0')
+
+    def _schedule_live_save(self):
+        """Write the live transcript once LIVE_SAVE_DEBOUNCE_MS after the first unsaved segment"""
+        if self._live_save_timer is None:
+            self._live_save_timer = self.root.after(LIVE_SAVE_DEBOUNCE_MS, self._flush_live_save)
+
+    def _flush_live_save(self):
+        """Timer callback: one write covering every segment since the last one"""
+        self._live_save_timer = None
         if self.is_live_transcribing:
             self._save_live_transcript()
 
     def _save_live_transcript(self):
-        """Write live transcript to JSON for overlay integration"""
-        try:
-            os.makedirs(self.live_transcript_dir, exist_ok=True)
-
-            data = {
-                'timestamp': datetime.now().isoformat(),
-                'segments': self.transcription_segments,
-                'session_id': str(self.live_start_time) if self.live_start_time else None,
-                'is_active': self.is_live_transcribing
-            }
-
-            # Write to temp file first, then rename for atomic write
-            tmp_path = self.live_transcript_path + '.tmp'
-            with open(tmp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
-            os.replace(tmp_path, self.live_transcript_path)
-        except Exception as e:
-            print(f"[Transcript export] Error: {e}")
+        """Queue updated session metadata for the overlay (segments are appended separately)"""
+        self._live_save_queue.put(('meta', {
+            'timestamp': datetime.now().isoformat(),
+            'session_id': str(self.live_start_time) if self.live_start_time else None,
+            'is_active': self.is_live_transcribing,
+            'count': self._live_saved_count
+        }))
+
+    def _reset_live_transcript(self):
+        """Start a fresh segment file holding the current transcript, and mark it active"""
+        segments = self.transcription_segments[:]
+        self._live_saved_count = len(segments)
+        self._live_save_queue.put(('reset', segments))
+        self._save_live_transcript()
+
+    def _append_live_segments(self, segments):
+        """Queue new segments to be appended to the overlay's segment file"""
+        self._live_saved_count += len(segments)
+        self._live_save_queue.put(('append', segments))
 
     def _clear_live_transcript(self):
         """Mark live transcript as inactive"""
-        try:
-            if os.path.exists(self.live_transcript_path):
-                data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'segments': self.transcription_segments,
-                    'session_id': None,
-                    'is_active': False
-                }
-                with open(self.live_transcript_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False)
-        except Exception as e:
-            print(f"[Transcript export] Error clearing: {e}")
+        # Always queued: the writer may not have created the metadata file yet, and it
+        # decides in order whether there is anything to mark inactive
+        self._live_save_queue.put(('meta', {
+            'timestamp': datetime.now().isoformat(),
+            'session_id': None,
+            'is_active': False,
+            'count': self._live_saved_count
+        }))
+
+    def _live_transcript_writer(self):
+        """
+        Writer thread for the overlay files, off the Tk thread. Segments are
+        appended one JSON object per line, so each costs O(1) to write; the
+        small metadata file (with the segment count) is replaced atomically.
+        """
+        segment_file = None
+        while True:
+            kind, payload = self._live_save_queue.get()
+            try:
+                os.makedirs(self.live_transcript_dir, exist_ok=True)
+
+                if kind == 'meta':
+                    if (not payload['is_active'] and segment_file is None
+                            and not os.path.exists(self.live_transcript_meta_path)):
+                        continue  # no session was ever exported; nothing for the overlay to see
+                    # Write to temp file first, then rename for atomic write
+                    tmp_path = self.live_transcript_meta_path + '.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(payload, f, ensure_ascii=False)
+                    os.replace(tmp_path, self.live_transcript_meta_path)
+                    if not payload['is_active'] and segment_file is not None:
+                        segment_file.close()
+                        segment_file = None
+                    continue
+
+                if kind == 'reset' or segment_file is None:
+                    if segment_file is not None:
+                        segment_file.close()
+                    segment_file = open(self.live_transcript_path, 'w' if kind == 'reset' else 'a',
+                                        encoding='utf-8')
+                segment_file.writelines(json.dumps(seg, ensure_ascii=False) + '\n' for seg in payload)
+                segment_file.flush()  # the overlay may read between segment batches
+            except Exception as e:
+                print(f"[Transcript export] Error: {e}")
 
     def _clear_transcription(self):
         """Clear the transcription"""
         if messagebox.askyesno("Confirm", "Clear all transcription?"):
             self.text_area.delete(1.0, tk.END)
             self.transcription_segments = []
+            if self.is_live_transcribing:
+                self._reset_live_transcript()
 
     def _save_transcription(self):
         """Save transcription to file"""
@@ -473,17 +665,24 @@ class TranscriberUI:
             return
 
         default_filename = f"transcription_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialfile=default_filename
-        )
+        filename = self._save_dialog.show(initialfile=default_filename)
 
         if filename:
-            if self.transcriber.save_transcription(self.transcription_segments, filename):
-                messagebox.showinfo("Success", f"Transcription saved to:\n{filename}")
-            else:
-                messagebox.showerror("Error", "Failed to save transcription")
+            # Snapshot the list: live segments may keep arriving while the file is written
+            segments = list(self.transcription_segments)
+            asyncio.run_coroutine_threadsafe(self._save_file_async(segments, filename), self._loop)
+
+    async def _save_file_async(self, segments, filename):
+        """Write the transcript off the Tk thread, then report on it"""
+        saved = await asyncio.to_thread(self.transcriber.save_transcription, segments, filename)
+        self._call_in_ui(self._show_save_result, saved, filename)
+
+    def _show_save_result(self, saved, filename):
+        """Report the outcome of a save on the Tk thread"""
+        if saved:
+            messagebox.showinfo("Success", f"Transcription saved to:\n{filename}")
+        else:
+            messagebox.showerror("Error", "Failed to save transcription")
 
     def _upload_video(self):
         """Upload and transcribe a video/audio file"""
@@ -491,32 +690,13 @@ class TranscriberUI:
             messagebox.showinfo("Info", "Stop live transcription before uploading a file.")
             return
 
-        file_path = filedialog.askopenfilename(
-            title="Select Video or Audio File",
-            filetypes=[
-                ("Video files", "*.mp4 *.mkv *.avi *.webm *.mov *.wmv"),
-                ("Audio files", "*.mp3 *.wav *.m4a *.ogg *.flac *.wma"),
-                ("All files", "*.*")
-            ]
-        )
+        file_path = self._open_dialog.show()
 
         if not file_path:
             return
 
-        # Load model if not loaded
-        if self.transcriber.model is None:
-            self._update_status("Loading model...")
-            self.root.update()
-
-            model_size = self.model_var.get()
-            language = self.language_var.get()
-            self.transcriber.model_size = model_size
-            self.transcriber.language = None if language == "auto" else language
-
-            if not self.transcriber.load_model():
-                messagebox.showerror("Error", "Failed to load Whisper model")
-                self._update_status("Ready \u2014 Upload a file or start live transcription")
-                return
+        # Settings are read here on the Tk thread; the model itself loads in the file job
+        settings = (self.model_var.get(), self.language_var.get())
 
         # Disable buttons during processing
         self.upload_btn.config(state='disabled')
@@ -524,46 +704,127 @@ class TranscriberUI:
 
         # Show header
         filename = os.path.basename(file_path)
-        self.text_area.insert(tk.END, f"--- Transcription: {filename} ---\n\n")
-        self.text_area.see(tk.END)
+        self._append_text(f"--- Transcription: {filename} ---\n\n")
+
+        # The persistent loop runs the file job; no thread is created per upload
+        asyncio.run_coroutine_threadsafe(self._process_file_async(file_path, filename, settings), self._loop)
 
-        def process_file():
-            error_msg = None
-
-            def on_progress(status):
-                nonlocal error_msg
-                if status.startswith("Error:"):
-                    error_msg = status
-                    self.root.after(0, self._update_status, status)
-                elif status.startswith("__segment__"):
-                    parts = status[len("__segment__"):].split("|", 2)
-                    if len(parts) == 3:
-                        seg = {'start': float(parts[0]), 'end': float(parts[1]), 'text': parts[2]}
-                        self.root.after(0, self._add_transcription_segment, seg)
-                else:
-                    self.root.after(0, self._update_status, status)
-
-            segments = self.transcriber.transcribe_file(file_path, progress_callback=on_progress)
-
-            def show_results():
-                if segments:
-                    self.text_area.insert(tk.END, f"\n--- End of {filename} ---\n\n")
-                    self.text_area.see(tk.END)
-                    self._update_status(f"Done - {len(segments)} segments from {filename}")
-                elif not error_msg:
-                    messagebox.showwarning("Warning", "No transcription segments were generated.\n\n"
-                                           "Check the terminal for more details.")
-                    self._update_status("Ready \u2014 Upload a file or start live transcription")
-                else:
-                    self._update_status("Ready \u2014 Upload a file or start live transcription")
-
-                self.upload_btn.config(state='normal')
-                self.live_btn.config(state='normal')
-
-            self.root.after(0, show_results)
-
-        thread = threading.Thread(target=process_file, daemon=True)
-        thread.start()
+    async def _ensure_model_async(self, model_size, language):
+        """
+        Make sure the model for these settings is loaded, loading it if needed.
+        Runs on the event loop, so callers (startup preload, file job, live
+        start) share one in-flight load instead of loading twice.
+
+        Returns:
+            True once the model is loaded, False if loading failed
+        """
+        settings = (model_size, language)
+        while self._model_load is None or self._model_settings != settings:
+            if self._model_load is not None and not self._model_load.done():
+                # Another load is running; let it finish before swapping settings
+                await asyncio.wait([self._model_load])
+                continue
+            self.transcriber.model_size = model_size
+            self.transcriber.language = None if language == "auto" else language
+            self._model_settings = settings
+            self._loading_status_generation = self._post_status("Loading model...")
+            # Daemon thread: closing the window mid-download must not wait for the load to finish
+            self._model_load = self._in_daemon_thread(self.transcriber.load_model)
+
+        load = self._model_load
+        try:
+            loaded = await load
+        except Exception:
+            # e.g. ImportError when no Whisper backend is installed
+            logger.exception("Model load failed")
+            self._post_status("Error: failed to load Whisper model")
+            loaded = False
+        if not loaded and self._model_load is load:
+            self._model_load = None  # let the next caller retry
+        return loaded
+
+    async def _preload_model_async(self, settings):
+        """Load the selected model at startup, while the user is still picking a file"""
+        if await self._ensure_model_async(*settings):
+            # Only replace "Loading model..." itself, not a status posted since (file or live started)
+            if self._loading_status_generation is not None:
+                self._post_status("Ready \u2014 Upload a file or start live transcription",
+                                  if_generation=self._loading_status_generation)
+        else:
+            self._post_status("Model preload failed \u2014 it will be retried on first use")
+
+    async def _process_file_async(self, file_path, filename, settings):
+        """Transcribe a file off the Tk thread and hand the results back to it"""
+        if not await self._ensure_model_async(*settings):
+            self._call_in_ui(self._show_load_failure)
+            return
+
+        self._file_error = None
+        # Not asyncio.to_thread: PyAV decode and whole-file VAD can't see _closing, and the
+        # default executor's threads are joined at exit, so closing the window would leave
+        # a hidden process running until the file is done
+        segments = await self._in_daemon_thread(self.transcriber.transcribe_file, file_path,
+                                                self._on_file_progress, self._closing)
+        if self._closing.is_set():
+            return
+        self._call_in_ui(self._show_file_results, filename, segments, self._file_error)
+
+    def _in_daemon_thread(self, func, *args):
+        """
+        Run func(*args) on a new daemon thread and return an awaitable for its
+        result (call on the event loop). Unlike asyncio.to_thread, the thread
+        never holds up interpreter exit.
+        """
+        future = self._loop.create_future()
+
+        def settle(result, error):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def run():
+            try:
+                result = func(*args)
+            except Exception as e:
+                self._loop.call_soon_threadsafe(settle, None, e)
+            else:
+                self._loop.call_soon_threadsafe(settle, result, None)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _on_file_progress(self, status):
+        """Progress callback for the file job (runs on its worker thread)"""
+        if status.startswith("Error:"):
+            self._file_error = status
+        # Coalesced: a burst of progress ticks between polls costs one label update
+        self._post_status(status)
+
+    def _show_load_failure(self):
+        """Report a failed model load from the file job on the Tk thread"""
+        messagebox.showerror("Error", "Failed to load Whisper model")
+        self._update_status("Ready \u2014 Upload a file or start live transcription")
+        self.upload_btn.config(state='normal')
+        self.live_btn.config(state='normal')
+
+    def _show_file_results(self, filename, segments, error_msg):
+        """Finish a file transcription on the Tk thread"""
+        # Whatever arrived since the last poll, and the footer, in one insert
+        self._flush_segments(f"\n--- End of {filename} ---\n\n" if segments else "")
+        if segments:
+            self._update_status(f"Done - {len(segments)} segments from {filename}")
+        elif not error_msg:
+            messagebox.showwarning("Warning", "No transcription segments were generated.\n\n"
+                                   "Check the terminal for more details.")
+            self._update_status("Ready \u2014 Upload a file or start live transcription")
+        else:
+            self._update_status("Ready \u2014 Upload a file or start live transcription")
+
+        self.upload_btn.config(state='normal')
+        self.live_btn.config(state='normal')
 
     # --- Window Controls ---
 
@@ -571,18 +832,48 @@ class TranscriberUI:
         """Toggle always on top"""
         self.root.attributes('-topmost', self.always_on_top_var.get())
 
+    def _post_status(self, status, if_generation=None):
+        """
+        Queue a status for the next poll; safe from any thread.
+
+        With if_generation, the status is only posted if no other status has
+        been posted or shown since that generation.
+
+        Returns:
+            The new status generation, or None if the status was not posted
+        """
+        with self._status_lock:
+            if if_generation is not None and if_generation != self._status_generation:
+                return None
+            self._latest_status = status
+            self._status_generation += 1
+            return self._status_generation
+
     def _update_status(self, status):
-        """Update status label"""
+        """Update status label now (Tk thread)"""
+        with self._status_lock:
+            self._status_generation += 1
+        self._show_status(status)
+
+    def _show_status(self, status):
+        """Set the status label text"""
+        if self.status_var.get() == status:
+            return  # same text: skip the trace callbacks and label redraw
         self.status_var.set(status)
 
     def run(self):
         """Start the UI main loop"""
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        # Warm the model while the user is still choosing what to do
+        settings = (self.model_var.get(), self.language_var.get())
+        asyncio.run_coroutine_threadsafe(self._preload_model_async(settings), self._loop)
         self.root.mainloop()
 
     def _on_closing(self):
         """Handle window closing"""
+        self._closing.set()
         if self.is_live_transcribing:
             self.audio_capture.stop_recording()
         self.audio_capture.cleanup()
+        self._loop.call_soon_threadsafe(self._loop.stop)
         self.root.destroy()